@@ -1,6 +1,10 @@
 import numpy as np
 import pandas as pd
+import hashlib
+import multiprocessing
 import os
+import shutil
+import tempfile
 import traceback
 import utils
 import rpy2
@@ -12,7 +16,65 @@ import time
 
 from rpy2.robjects import pandas2ri, numpy2ri
 from rpy2.robjects.packages import importr
-from rpy2.robjects.vectors import StrVector, IntVector
+from rpy2.robjects.vectors import StrVector, IntVector, FloatVector
+
+# rpy2-arrow provides a zero-copy pandas -> R transfer. It is optional;
+# without it dataframes fall back to the per-column pandas2ri conversion.
+try:
+    import pyarrow as pa
+    import rpy2_arrow.arrow as pyra
+except ImportError:
+    pa = None
+    pyra = None
+
+# numba is optional; without it the probability transform falls back to
+# the vectorized numpy expression.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _logodds_to_proba(pred):
+        out = np.empty_like(pred)
+        for i in numba.prange(pred.size):
+            out[i] = 1.0 / (1.0 + np.exp(-pred[i]))
+        return out
+else:
+    def _logodds_to_proba(pred):
+        return 1.0 / (1.0 + np.exp(-pred))
+
+
+def _narrow_numeric(arr):
+    """ Downcasts a 64-bit integer array to int32 when its values fit,
+        halving the bytes moved across the R bridge. R stores numeric
+        vectors as doubles, so narrower floats would just be widened back
+        on arrival; only the integer path wins.
+    Args:
+      arr - A numpy array
+    Returns: The array, as int32 when that is lossless
+    """
+    if arr.dtype == np.int64 and \
+            (arr.size == 0 or (arr.min() >= np.iinfo(np.int32).min
+                               and arr.max() <= np.iinfo(np.int32).max)):
+        return arr.astype(np.int32)
+    return arr
+
+
+def _numeric_to_r(arr):
+    """ Exposes a numeric numpy array to R through the buffer protocol,
+        skipping the per-element numpy2ri conversion and its extra copy.
+    Args:
+      arr - A numpy array (or sequence) of numbers
+    Returns: An R integer or numeric vector
+    """
+    arr = np.ascontiguousarray(arr)
+    if arr.dtype == np.int32:
+        return rinterface.IntSexpVector.from_memoryview(memoryview(arr))
+    return rinterface.FloatSexpVector.from_memoryview(
+            memoryview(arr.astype(np.float64, copy=False)))
 
 
 # TODO: Add _generate_rules() to the rules getter, if it does not already exist
@@ -20,12 +82,16 @@ class RuleFit(object):
     """Wrapper for rulefit algorithm in R
     """
 
-    def __init__(self, platform, rfhome, log_path=None):
+    def __init__(self, platform, rfhome, log_path=None, cache_dir=None):
         # Initialize R instance.
         self._initialize_r_instance(platform, rfhome)
         self.logger = utils.get_logger(log_path if log_path else \
                                            os.path.join(os.getcwd(),
                                                         'rulefit.log'))
+        # Optional on-disk fit cache; see fit().
+        self.cache_dir = cache_dir
+        if cache_dir is not None and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
 
     @property
     def rules(self):
@@ -53,11 +119,9 @@ class RuleFit(object):
           platform - OS. windows, linux or mac
           rfhome - path to R rulefit directory.
         """
-        pandas2ri.activate()
-        numpy2ri.activate()
         try:
-            utils = importr('utils')
-            utils.chooseCRANmirror(ind=1)
+            r_utils = importr('utils')
+            r_utils.chooseCRANmirror(ind=1)
             robjects.globalenv['platform'] = platform
             robjects.globalenv['rfhome'] = rfhome
             self.rfhome = rfhome
@@ -72,21 +136,269 @@ class RuleFit(object):
             self.logger.error('RRuntimeError thrown. Try to re-run or check R'
                               ' rulefit path. Traceback: {}' \
                               .format(traceback.format_exc()))
+        self._parse_r_functions()
+
+    def _parse_r_functions(self):
+        """ Parses each embedded R script into an R closure once and stores
+            the closures on the instance. Repeat calls (e.g. predict inside
+            a scoring loop) then skip the per-call parse/eval step.
+        """
+        # Shared setup for forked workers: the rulefit backend keeps
+        # scratch files under rfhome, so each worker runs in a private
+        # temp copy of it.
+        robjects.r("""
+               rf.worker.init <- function(tag){
+                 wd <- file.path(tempdir(),
+                                 paste(tag, Sys.getpid(), sep='.'))
+                 dir.create(wd, showWarnings=FALSE, recursive=TRUE)
+                 file.copy(list.files(rfhome, full.names=TRUE), wd,
+                           recursive=TRUE)
+                 rfhome <<- wd
+                 source(file.path(wd, 'rulefit.r'))
+               }
+               """)
+        self._r_null_models = robjects.r("""
+               function(n, quiet, ncores){
+                 if(ncores > 1){
+                   one.null <- function(i){
+                     rf.worker.init(paste('rfnull', i, sep='.'))
+                     intnull(ntimes=1, quiet=TRUE)
+                   }
+                   if(.Platform$OS.type == 'windows'){
+                     cl <- parallel::makeCluster(ncores)
+                     on.exit(parallel::stopCluster(cl), add=TRUE)
+                     parallel::clusterSetRNGStream(cl)
+                     parallel::clusterExport(
+                         cl, c('rfhome', 'platform', 'rf.worker.init'))
+                     models <- parallel::parLapply(cl, seq_len(n), one.null)
+                   } else {
+                     old.kind <- RNGkind("L'Ecuyer-CMRG")
+                     on.exit(do.call(RNGkind, as.list(old.kind)), add=TRUE)
+                     models <- parallel::mclapply(seq_len(n), one.null,
+                                                  mc.cores=ncores,
+                                                  mc.set.seed=TRUE)
+                   }
+                   null.models <<- do.call(c, models)
+                 } else {
+                   null.models <<- intnull(ntimes=n, quiet=quiet)
+                 }
+               }
+               """)
+        self._r_interact = robjects.r("""
+              function(ncols, nval){
+                if(exists("null.models")){
+                  interactions <- interact(c(1:ncols), null.models,
+                                           nval=nval,
+                                           plot=F)
+                  } else {
+                    interactions <- interact(c(1:ncols), nval=nval, plot=F)
+                }
+              }
+              """)
+        self._r_check_null = robjects.r("""
+                function(){
+                  if(exists("null.models")){
+                    return(T)
+                  } else {
+                    return(F)
+                  }
+                }
+                """)
+        self._r_two_var_interact = robjects.r("""
+              function(target, vars, nval){
+                interactions <- twovarint(tvar=target, vars=vars, null.models,
+                                          nval=nval, plot=F)
+              }
+              """)
+        self._r_three_var_interact = robjects.r("""
+              function(tvar1, tvar2, vars, nval){
+                interactions <- threevarint(tvar1=tvar1, tvar2=tvar2,
+                                            vars=vars, null.models,
+                                            nval=nval, plot=F)
+              }
+              """)
+        self._r_single_dep = robjects.r("""
+              function(vars, nval, nav){
+                singleplot(vars)
+              }
+              """)
+        self._r_pair_dep = robjects.r("""
+              function(var1, var2, plot_type){
+                pairplot(var1, var2, type=plot_type)
+              }
+              """)
+        self._r_rules = robjects.r("""
+                function(beg, end, x, wt){
+                  if(!is.null(x)){
+                    if(!is.data.frame(x)){
+                      x <- as.data.frame(x)
+                    }
+                    rules(beg, end, x, wt)
+                  } else {
+                    rules(beg=beg, end=end, wt=wt)
+                  }
+                }
+                """)
+        self._r_predict = robjects.r("""
+                  function(xp){
+                  if(!is.data.frame(xp)){
+                    xp <- as.data.frame(xp)
+                  }
+                  yp <<- rfpred(xp)
+                  }
+                  """)
+        self._r_xval = robjects.r("""
+               function(nfold, quiet){
+               xval <<- rfxval(nfold, quiet)
+               }
+               """)
+        self._r_xval_par = robjects.r("""
+               function(nfold, ncores){
+                 x <- fit.args$x
+                 y <- fit.args$y
+                 y.is.ref <- length(y) == 1
+                 if(y.is.ref){
+                   # Materialized for the scoring aggregation only; the
+                   # fold refits keep the scalar reference so the backend
+                   # excludes the column from the predictors itself.
+                   y <- x[[fit.args$y]]
+                 }
+                 n <- nrow(x)
+                 folds <- sample(rep(seq_len(nfold), length.out=n))
+                 fold.fit <- function(k){
+                   rf.worker.init(paste('rfxval', k, sep='.'))
+                   a <- fit.args
+                   a$x <- x[folds != k, , drop=FALSE]
+                   if(!y.is.ref){
+                     a$y <- y[folds != k]
+                   }
+                   if(length(a$wt) > 1){
+                     # Scalar weights reference a column of x; vectors
+                     # must be subset along with the rows.
+                     a$wt <- a$wt[folds != k]
+                   }
+                   a$test.reps <- 0
+                   a$quiet <- TRUE
+                   do.call(rulefit, a)
+                   as.numeric(rfpred(x[folds == k, , drop=FALSE]))
+                 }
+                 if(.Platform$OS.type == 'windows'){
+                   cl <- parallel::makeCluster(ncores)
+                   on.exit(parallel::stopCluster(cl), add=TRUE)
+                   parallel::clusterExport(
+                       cl, c('rfhome', 'platform', 'rf.worker.init',
+                             'fit.args'))
+                   preds <- parallel::parLapply(cl, seq_len(nfold),
+                                                fold.fit)
+                 } else {
+                   preds <- parallel::mclapply(seq_len(nfold), fold.fit,
+                                               mc.cores=ncores)
+                 }
+                 yp <- numeric(n)
+                 for(k in seq_len(nfold)){
+                   yp[folds == k] <- preds[[k]]
+                 }
+                 list(yp, y)
+               }
+               """)
+        self._r_fit = robjects.r("""
+                  function(args){
+                    if(!is.data.frame(args$x)){
+                      args$x <- as.data.frame(args$x)
+                    }
+                    fit.args <<- args
+                    fit <<- do.call(rulefit, args)
+                    stats <<- runstats(fit)
+                    var_imp <<- varimp(plot=F)
+                  }
+                  """)
+        self._r_cache_save = robjects.r("""
+               function(path){
+                 saveRDS(list(fit=fit, stats=stats, var.imp=var_imp,
+                              fit.args=fit.args), path)
+               }
+               """)
+        self._r_cache_load = robjects.r("""
+               function(path){
+                 cached <- readRDS(path)
+                 fit <<- cached$fit
+                 stats <<- cached$stats
+                 var_imp <<- cached$var.imp
+                 fit.args <<- cached$fit.args
+               }
+               """)
+        self._r_length = robjects.r['length']
+        self._r_seq_len = robjects.r['seq_len']
+
+    def _dataframe_to_r(self, x):
+        """ Converts a pandas dataframe to an R object. Uses the zero-copy
+            Arrow transfer when rpy2-arrow is available, falling back to the
+            column-by-column pandas2ri conversion otherwise. The R side turns
+            Arrow tables back into data frames with as.data.frame().
+        Args:
+          x - A pandas dataframe
+        Returns: An R object that the embedded R functions accept as x
+        """
+        if pyra is not None:
+            return pyra.converter.py2rpy(
+                    pa.Table.from_pandas(x, preserve_index=False))
+        # The dataframe rule converts each column through the ambient
+        # converter, so the pandas rules must be active around the call.
+        with (robjects.default_converter + pandas2ri.converter).context():
+            return pandas2ri.py2rpy(x)
+
+    def _fit_cache_key(self, x, y, params):
+        """ Builds a stable digest of the training data and hyperparameters
+            used to key the on-disk fit cache.
+        Args:
+          x - A pandas dataframe of training data
+          y - The response values or column number
+          params - Dict of the remaining fit arguments
+        Returns: A hex digest string
+        """
+        h = hashlib.sha256()
+        h.update(pd.util.hash_pandas_object(x, index=False).values.tobytes())
+        h.update('|'.join(x.columns.astype(str)).encode())
+        if isinstance(y, (np.ndarray, pd.Series)):
+            h.update(np.ascontiguousarray(y).tobytes())
+        else:
+            h.update(repr(y).encode())
+        h.update(repr(sorted(params.items())).encode())
+        return h.hexdigest()
+
+    def _snapshot_rfhome(self, cache_path):
+        """ Copies rfhome into a cache entry. The rulefit backend keeps the
+            fitted model in scratch files under rfhome, so the RDS globals
+            alone do not capture a fit.
+        Args:
+          cache_path - Directory of the cache entry
+        """
+        dest = os.path.join(cache_path, 'rfhome')
+        if os.path.exists(dest):
+            shutil.rmtree(dest)
+        shutil.copytree(self.rfhome, dest)
+
+    def _restore_rfhome_snapshot(self, cache_path):
+        """ Copies a cached rfhome snapshot back over the live rfhome so
+            rfpred/rules/rfxval see the cached model's scratch files.
+        Args:
+          cache_path - Directory of the cache entry
+        """
+        shutil.copytree(os.path.join(cache_path, 'rfhome'), self.rfhome,
+                        dirs_exist_ok=True)
 
     def _load_r_variable_importance_objects(self):
         """ Loads R variable importance objects
 
         Returns: Pandas dataframe of variable importances
         """
-        data = [value for value in list(robjects.globalenv['var_imp'][0])]
-        index = [self.data['x'].columns.values[int(var - 1)]
-                 for var in list(robjects.globalenv['var_imp'][1])]
-
-        temp_var_imp = pd.DataFrame(data=data, index=index,
-                                    columns=['variable_importance'])
-        temp_var_imp = temp_var_imp.reset_index() \
-            .rename(columns={'index': 'var_name'})
-        return temp_var_imp
+        var_imp = robjects.globalenv['var_imp']
+        data = np.asarray(var_imp[0])
+        idx = np.asarray(var_imp[1]).astype(np.intp) - 1
+        return pd.DataFrame({
+            'var_name': self.data['x'].columns.values[idx],
+            'variable_importance': data
+        })
 
     def _update_model_properties(self, x, y):
         """ Updates internal values after fitting
@@ -103,7 +415,7 @@ class RuleFit(object):
         self._variable_importances = self._load_r_variable_importance_objects()
 
     # ===== Variable Interactions =====
-    def _generate_interaction_null_models(self, n, quiet):
+    def _generate_interaction_null_models(self, n, quiet, ncores=1):
         """ Generates bootstrapped null interaction models to calibrate
             interaction effects. See FP 2004 8.3. This will create a global object
             in the R instance. This function needs to be called before calling
@@ -111,43 +423,34 @@ class RuleFit(object):
         Args:
           n - Number of models to generate
           quiet - True / False
+          ncores - Number of R worker processes used to build the models in
+                   parallel. Each model is an independent bootstrap, so
+                   speedup is roughly min(n, ncores). Workers draw from
+                   L'Ecuyer-CMRG RNG streams so results stay reproducible.
         """
-        null_str = """
-               function(n, quiet){
-                 null.models <<- intnull(ntimes=n, quiet=quiet)
-               }
-               """
-        robjects.r(null_str)(n, quiet)
+        self._r_null_models(n, quiet, ncores)
 
-    def generate_intr_effects(self, nval=10, n=10, quiet=False, plot=True):
+    def generate_intr_effects(self, nval=10, n=10, quiet=False, plot=True,
+                              ncores=1):
         """ Loads R variable interaction effect objects
         Args:
           nval - Number of evaluation points used for calculation
           n - Number of null models to generate for interaction calibaration
           quiet - Determines whether to print intermediate data.
+          ncores - Number of R worker processes used for null model
+                   generation.
         Returns: Pandas dataframe of interaction effects
         """
 
-        self._generate_interaction_null_models(n, quiet)
+        self._generate_interaction_null_models(n, quiet, ncores)
 
-        int_str = """
-              function(ncols, nval){
-                if(exists("null.models")){
-                  interactions <- interact(c(1:ncols), null.models, 
-                                           nval=nval, 
-                                           plot=F)
-                  } else {
-                    interactions <- interact(c(1:ncols), nval=nval, plot=F)
-                }
-              }
-              """
         ncols = len(self._data['x'].columns.values)
-        r_interact = robjects.r(int_str)(ncols, nval)
+        r_interact = self._r_interact(ncols, nval)
 
         interact = pd.DataFrame({
-            'interact_str': list(r_interact[0]),
-            'exp_null_int': list(r_interact[1]),
-            'std_null_int': list(r_interact[2])
+            'interact_str': np.asarray(r_interact[0]),
+            'exp_null_int': np.asarray(r_interact[1]),
+            'std_null_int': np.asarray(r_interact[2])
         },
                 index=self._data['x'].columns)
 
@@ -176,37 +479,24 @@ class RuleFit(object):
         Returns: Pandas dataframe of interaction effects
         """
         # Check if null.models have already been generated
-        check_str = """
-                function(){
-                  if(exists("null.models")){
-                    return(T)
-                  } else {
-                    return(F)
-                  }
-                }
-                """
-        if not robjects.r(check_str)()[0]:
+        if not self._r_check_null()[0]:
             self.logger.info(
                     'Null models not generated, generating null models '
                     '(n=10)')
             self._generate_interaction_null_models(10, quiet=False)
 
-        int_str = """
-              function(target, vars, nval){
-                interactions <- twovarint(tvar=target, vars=vars, null.models, 
-                                          nval=nval, plot=F)
-              }
-              """
         # Check the input type. If int, add one, if string do nothing.
-        target = target if type(target) is str else target + 1
-        vars = [var if type(var) is str else var + 1 for var in vars]
-        r_interact = robjects.r(int_str)(target,
-                                         robjects.Vector(np.array(vars)),
-                                         nval)
+        target = target if isinstance(target, str) else int(target) + 1
+        if isinstance(vars[0], str):
+            r_vars = StrVector(vars)
+        else:
+            vars = np.asarray(vars, dtype=np.int32) + 1
+            r_vars = _numeric_to_r(vars)
+        r_interact = self._r_two_var_interact(target, r_vars, nval)
         interact = pd.DataFrame({
-            'interact_str': list(r_interact[0]),
-            'exp_null_int': list(r_interact[1]),
-            'std_null_int': list(r_interact[2])
+            'interact_str': np.asarray(r_interact[0]),
+            'exp_null_int': np.asarray(r_interact[1]),
+            'std_null_int': np.asarray(r_interact[2])
         },
                 index=vars)
 
@@ -238,38 +528,25 @@ class RuleFit(object):
           Pandas dataframe of interaction effects
         """
         # Check if null.models have already been generated
-        check_str = """
-                function(){
-                  if(exists("null.models")){
-                    return(T)
-                  } else {
-                    return(F)
-                  }
-                }
-                """
-        if not robjects.r(check_str)()[0]:
+        if not self._r_check_null()[0]:
             self.logger.info(
                     'Null models not generated, generating null models '
                     '(n=10)')
             self._generate_interaction_null_models(10, quiet=False)
 
-        int_str = """
-              function(tvar1, tvar2, vars, nval){
-                interactions <- threevarint(tvar1=tvar1, tvar2=tvar2,
-                                            vars=vars, null.models, 
-                                            nval=nval, plot=F)
-              }
-              """
         # Check the input type. If int, add one, if string do nothing.
-        tvar1 = tvar1 if type(tvar1) is str else tvar1 + 1
-        tvar2 = tvar2 if type(tvar2) is str else tvar2 + 1
-        vars = [var if type(var) is str else var + 1 for var in vars]
-        r_interact = robjects.r(int_str)(tvar1, tvar2,
-                                         robjects.Vector(np.array(vars)), nval)
+        tvar1 = tvar1 if isinstance(tvar1, str) else int(tvar1) + 1
+        tvar2 = tvar2 if isinstance(tvar2, str) else int(tvar2) + 1
+        if isinstance(vars[0], str):
+            r_vars = StrVector(vars)
+        else:
+            vars = np.asarray(vars, dtype=np.int32) + 1
+            r_vars = _numeric_to_r(vars)
+        r_interact = self._r_three_var_interact(tvar1, tvar2, r_vars, nval)
         interact = pd.DataFrame({
-            'interact_str': list(r_interact[0]),
-            'exp_null_int': list(r_interact[1]),
-            'std_null_int': list(r_interact[2])
+            'interact_str': np.asarray(r_interact[0]),
+            'exp_null_int': np.asarray(r_interact[1]),
+            'std_null_int': np.asarray(r_interact[2])
         },
                 index=vars)
 
@@ -296,14 +573,11 @@ class RuleFit(object):
                 Higher values give more accurate calculations with diminishing
                 returns.
         """
-        dep_str = """
-              function(vars, nval, nav){
-                singleplot(vars)
-              }
-              """
-        if any([type(var) == int for var in vars]):
+        if any(isinstance(var, (int, np.integer)) for var in vars):
             vars = [var + 1 for var in vars]
-        robjects.r(dep_str)(robjects.Vector(np.array(vars)), nav)
+        r_vars = StrVector(vars) if isinstance(vars[0], str) \
+            else _numeric_to_r(np.asarray(vars, dtype=np.int32))
+        self._r_single_dep(r_vars, nav)
 
     def double_partial_dependencies(self, var1, var2, plot_type='image'):
         """ Display two variable dependancy plot.
@@ -312,12 +586,7 @@ class RuleFit(object):
           var2 - Second variable for calculation. Cannot be the same as the first.
           plot_type - The top of plot to print. Possible values: 'image', 'contour'
         """
-        dep_str = """
-              function(var1, var2, plot_type){
-                pairplot(var1, var2, type=plot_type)
-              }
-              """
-        robjects.r(dep_str)(var1, var2, plot_type)
+        self._r_pair_dep(var1, var2, plot_type)
 
     def _generate_rules(self, x=None, wt=None):
         """ Extract generated rules from model object. This populations the rules
@@ -330,27 +599,17 @@ class RuleFit(object):
           wt - A list of weights for observations stored in x.
         """
 
-        if not wt:
-            wt = np.arange(1, self.data['x'].shape[0] + 1)
-        if not x:
+        if wt is None:
+            wt = self._r_seq_len(self.data['x'].shape[0])
+        else:
+            wt = _numeric_to_r(wt)
+        if x is None:
             x = rinterface.NULL
+        else:
+            x = self._dataframe_to_r(x)
 
-        rules_str = """
-                function(x, wt){
-                  beg = 1
-                  end = 99999999
-                  if(end > integer(fit[[1]][length(fit[[1]])])){
-                    end <- as.integer(fit[[1]][length(fit[[1]])])
-                  } 
-                  if(!is.null(x)){
-                    rules(beg, end, x, wt)
-                  } else {
-                    rules(beg=beg, end=end, wt=wt)
-                  }
-                }
-                """
         self.logger.info("Generating rules ...")
-        robjects.r(rules_str)(x, wt)
+        self._r_rules(1, self._n_rules, x, wt)
         self._rules = utils.parse_rules(
                 os.path.join(self.rfhome, 'rulesout.hlp'))
 
@@ -363,32 +622,84 @@ class RuleFit(object):
           log odds. The corresponding probabilities can be computed with
           probs = 1.0 / (1.0 + exp(-pred))
         """
-        predict_str = """
-                  function(xp){
-                  yp <<- rfpred(xp)
-                  }
-                  """
-        predict = np.array(robjects.r(predict_str)(x))
+        # np.asarray aliases the R vector's buffer instead of copying it;
+        # the array keeps the R vector alive through its .base reference.
+        predict = np.asarray(self._r_predict(self._dataframe_to_r(x)))
         return predict
 
-    def xval(self, nfold=10, quiet=False):
+    def predict_proba(self, x):
+        """ Predict class probabilities using a trained model. Applies the
+            logistic transform to the log odds returned by predict in a
+            single pass, numba-parallel across all cores when numba is
+            installed.
+        Args:
+          x - A pandas dataframe of input variables
+        Returns:
+          An array of probabilities for the +1 class
+        """
+        return _logodds_to_proba(self.predict(x))
+
+    def predict_batches(self, xs):
+        """ Predict values for several input batches with a single R call.
+            Scoring batches one at a time pays the dataframe conversion
+            and rpy2 round-trip per batch; concatenating first amortizes
+            both over the whole set.
+        Args:
+          xs - A list of pandas dataframes sharing the same columns
+        Returns:
+          A list of response arrays, one per input batch, in order
+        """
+        counts = np.fromiter((len(x) for x in xs), dtype=np.intp,
+                             count=len(xs))
+        pred = self.predict(pd.concat(xs, axis=0, copy=False))
+        return np.split(pred, np.cumsum(counts)[:-1])
+
+    def xval(self, nfold=10, quiet=False, ncores=1):
         """ Performs cross validation using current model. Will update
             corresponding properties in rulefit object
         Args:
           nfold - Number of folds >= 2
           quiet - True or False
+          ncores - Number of R worker processes used to fit folds in
+                   parallel. Folds are independent, so speedup is roughly
+                   min(nfold, ncores). 1 runs the serial rfxval path.
         Returns:
           Nothing. But will update the properties x_val_results
         """
 
-        xval_str = """
-               function(nfold, quiet){
-               xval <<- rfxval(nfold, quiet)
-               }
-               """
-        xval = robjects.r(xval_str)(nfold, quiet)
+        if ncores > 1:
+            res = self._r_xval_par(nfold, ncores)
+            yp = np.asarray(res[0])
+            y = np.asarray(res[1])
+            if self._rfmode == 'class':
+                probas = _logodds_to_proba(yp)
+                pos = y > 0
+                n_pos = int(pos.sum())
+                n_neg = len(y) - n_pos
+                ranks = np.empty(len(probas), dtype=np.float64)
+                ranks[np.argsort(probas, kind='mergesort')] = \
+                    np.arange(1, len(probas) + 1)
+                auc = (ranks[pos].sum() - n_pos * (n_pos + 1) / 2) \
+                    / (n_pos * n_neg)
+                err = np.sign(yp) != np.sign(y)
+                self._xval_results = {
+                    'probas': probas,
+                    'auc': auc,
+                    'avg_err': np.mean(err),
+                    'pos_err': np.mean(err[pos]),
+                    'neg_err': np.mean(err[~pos])
+                }
+            else:
+                self._xval_results = {
+                    'pred': yp,
+                    'avg_abs_err': np.mean(np.abs(y - yp)),
+                    'rms': np.sqrt(np.mean((y - yp) ** 2))
+                }
+            return
+
+        xval = self._r_xval(nfold, quiet)
         # Populate xval values
-        if robjects.r['length'](xval)[0] == 5:  # Classification
+        if self._r_length(xval)[0] == 5:  # Classification
             self._xval_results = {
                 'probas': list(xval[0]),
                 'auc': 1 - xval[1][0],
@@ -496,75 +807,177 @@ class RuleFit(object):
 
         # Set default values
         # Need to convert None values to r null type
-        if type(y) == int:  # Add one to y if its int as Rs index start at 1
-            y += 1
-        if wt is None:
-            wt = np.arange(1, x.shape[0] + 1)
+        if isinstance(y, (int, np.integer)):  # R indecies start at 1
+            y = int(y) + 1
+
+        # With a cache_dir configured, identical (x, y, hyperparams) fits
+        # are restored from disk instead of re-running the R solver. Each
+        # entry holds the R-side fit/stats/var_imp globals as an RDS file
+        # plus a snapshot of the rfhome scratch files that hold the actual
+        # backend model, so predict/xval/rules work the same after a hit.
+        # quiet is left out of the key since it does not affect the model.
+        cache_path = None
+        if self.cache_dir is not None:
+            params = dict(cat_vars=cat_vars, not_used=not_used, xmiss=xmiss,
+                          rfmode=rfmode, sparse=sparse, test_reps=test_reps,
+                          test_fract=test_fract, mod_sel=mod_sel,
+                          model_type=model_type, tree_size=tree_size,
+                          max_rules=max_rules, max_trms=max_trms, costs=costs,
+                          trim_qntl=trim_qntl, samp_fract=samp_fract,
+                          inter_supp=inter_supp, memory_par=memory_par,
+                          conv_thr=conv_thr, tree_store=tree_store,
+                          cat_store=cat_store,
+                          wt=wt.tobytes() if isinstance(wt, np.ndarray)
+                          else wt)
+            key = self._fit_cache_key(x, y, params)
+            cache_path = os.path.join(self.cache_dir, 'fit-{}'.format(key))
+            if os.path.isdir(cache_path):
+                self.logger.info('Restoring cached fit {}'.format(key))
+                self._restore_rfhome_snapshot(cache_path)
+                self._r_cache_load(os.path.join(cache_path, 'fit.rds'))
+                self._rfmode = rfmode
+                self._n_rules = \
+                    int(np.asarray(robjects.globalenv['fit'][0])[-1])
+                self._update_model_properties(x, y)
+                stats = robjects.globalenv['stats']
+                return (stats[0][0], stats[1][0], stats[2][0])
+
+        if test_reps is None or samp_fract is None:
+            # neff = sum(wt)^2 / sum(wt^2), computed once. np.dot does the
+            # squared sum in a single BLAS pass without the wt**2 temporary;
+            # for the default 1:n weights both sums have closed forms.
+            if wt is None:
+                n = x.shape[0]
+                s1 = n * (n + 1) / 2.0
+                s2 = n * (n + 1) * (2 * n + 1) / 6.0
+            else:
+                s1 = np.sum(wt, dtype=np.float64)
+                s2 = float(np.dot(wt, wt))
+            neff = s1 * s1 / s2
         if test_reps is None:
-            neff = np.sum(wt) ** 2 / np.sum(wt ** 2)
             test_reps = round(min(20, np.max([0.0, 5200 / neff - 2])))
         if samp_fract is None:
-            neff = np.sum(wt) ** 2 / np.sum(wt ** 2)
             samp_fract = min(1, (11 * np.sqrt(neff) + 1) / neff)
-        if cat_vars is None:
-            cat_vars = rinterface.NULL
-        if not_used is None:
-            not_used = rinterface.NULL
-
-        # Cant pass null default values to r function so those variables
-        # need to be not passed.
-        rulefit_str = """
-                  function(x, y, wt, cat_vars, not_used, xmiss, rfmode,
-                           sparse, test_reps, test_fract, mod_sel,
-                           model_type, tree_size, max_rules, max_trms,
-                           costs, trim_qntl, samp_fract, inter_supp,
-                           memory_par, conv_thr, quiet, tree_store, 
-                           cat_store){
-
-                    costs = c(costs[[1]], costs[[2]]) 
-                    args = list(x=x, y=y, wt=wt, cat.vars=cat_vars,
-                                not.used=not_used, xmiss=xmiss, rfmode=rfmode,
-                                sparse=sparse, test.reps=test_reps, 
-                                test.fract=test_fract, mod.sel=mod_sel,
-                                model.type=model_type, tree.size=tree_size,
-                                max.rules=max_rules, max.trms=max_trms,
-                                costs=costs, trim.qntl=trim_qntl, 
-                                samp.fract=samp_fract, inter.supp=inter_supp,
-                                memory.par=memory_par, conv.thr=conv_thr,
-                                quiet=quiet, tree.store=tree_store,
-                                cat.store=cat_store)
-                    count = 1
-                    for (i in 1:length(args)){
-                      if(is.null(args[[count]])){
-                        args[[count]] <- NULL
-                      } else {
-                        count = count + 1 
-                      }
-                    }
+        if wt is None:
+            # Build 1:n inside R; nothing to allocate or transfer from
+            # the Python side.
+            wt = self._r_seq_len(x.shape[0])
 
-                    fit <<- do.call(rulefit, args)
-                    stats <<- runstats(fit) 
-                    var_imp <<- varimp(plot=F)
-                  }
-                  """
         # Run rulefit model
-        rulefit = robjects.r(rulefit_str)
-        fit = rulefit(x, y, wt=wt, cat_vars=cat_vars, not_used=not_used,
-                      xmiss=xmiss, rfmode=rfmode, sparse=sparse,
-                      test_reps=test_reps, test_fract=test_fract,
-                      mod_sel=mod_sel, model_type=model_type,
-                      tree_size=tree_size, max_rules=max_rules,
-                      max_trms=max_trms, costs=costs, trim_qntl=trim_qntl,
-                      samp_fract=samp_fract, inter_supp=inter_supp,
-                      memory_par=memory_par, conv_thr=conv_thr, quiet=quiet,
-                      tree_store=tree_store, cat_store=cat_store)
+        self._rfmode = rfmode
+        if isinstance(wt, np.ndarray):
+            if rfmode == 'class':
+                wt = _narrow_numeric(wt)
+            wt = _numeric_to_r(wt)
+        if isinstance(y, (np.ndarray, pd.Series)):
+            y = np.asarray(y)
+            if rfmode == 'class':
+                # Class labels are +1/-1, so the narrow integer transfer
+                # always applies.
+                y = _narrow_numeric(y)
+            y = _numeric_to_r(y)
+        # Arguments left at None are simply omitted so rulefit's own
+        # defaults apply; nothing needs to be pruned R-side.
+        candidates = {
+            'x': self._dataframe_to_r(x),
+            'y': y,
+            'wt': wt,
+            'cat.vars': cat_vars,
+            'not.used': not_used,
+            'xmiss': xmiss,
+            'rfmode': rfmode,
+            'sparse': sparse,
+            'test.reps': test_reps,
+            'test.fract': test_fract,
+            'mod.sel': mod_sel,
+            'model.type': model_type,
+            'tree.size': tree_size,
+            'max.rules': max_rules,
+            'max.trms': max_trms,
+            'costs': FloatVector(costs),
+            'trim.qntl': trim_qntl,
+            'samp.fract': samp_fract,
+            'inter.supp': inter_supp,
+            'memory.par': memory_par,
+            'conv.thr': conv_thr,
+            'quiet': quiet,
+            'tree.store': tree_store,
+            'cat.store': cat_store
+        }
+        args = robjects.ListVector(
+                {k: v for k, v in candidates.items() if v is not None})
+        fit = self._r_fit(args)
+        # Total rule count, read once from the fitted model so rule
+        # extraction no longer has to clamp it R-side on every call.
+        self._n_rules = int(np.asarray(robjects.globalenv['fit'][0])[-1])
 
         # Update model properties
         self._update_model_properties(x, y)
 
         # Output fit statistics
-        fit_stats = (robjects.globalenv['stats'][0][0],
-                     robjects.globalenv['stats'][1][0],
-                     robjects.globalenv['stats'][2][0])
+        stats = robjects.globalenv['stats']
+        fit_stats = (stats[0][0], stats[1][0], stats[2][0])
+
+        if cache_path is not None:
+            if not os.path.exists(cache_path):
+                os.makedirs(cache_path)
+            self._r_cache_save(os.path.join(cache_path, 'fit.rds'))
+            self._snapshot_rfhome(cache_path)
 
         return fit_stats
+
+
+# Worker-process state for RuleFitPool. Each worker owns one embedded R
+# instance running against a private copy of rfhome.
+_worker_rf = None
+
+
+def _init_worker(platform, rfhome):
+    global _worker_rf
+    wd = os.path.join(tempfile.mkdtemp(prefix='rfworker'), 'rfhome')
+    shutil.copytree(rfhome, wd)
+    _worker_rf = RuleFit(platform, wd,
+                         log_path=os.path.join(wd, 'rulefit.log'))
+
+
+def _worker_fit(job):
+    x, y, kwargs = job
+    return _worker_rf.fit(x, y, **kwargs)
+
+
+class RuleFitPool(object):
+    """ Persistent pool of RuleFit worker processes. R is single threaded
+        per embedded instance, so fitting many models through one RuleFit
+        (hyperparameter search, nested CV, bootstrap model selection)
+        serializes them all; the pool runs up to ncores fits concurrently,
+        each worker holding its own R instance and private rfhome copy.
+    """
+
+    def __init__(self, platform, rfhome, ncores=None):
+        """
+        Args:
+          platform - OS. windows, linux or mac
+          rfhome - path to R rulefit directory. Copied once per worker.
+          ncores - Number of worker processes. Defaults to the machine's
+                   CPU count.
+        """
+        self._pool = multiprocessing.Pool(processes=ncores,
+                                          initializer=_init_worker,
+                                          initargs=(platform, rfhome))
+
+    def fit_many(self, jobs):
+        """ Fits one rulefit model per job across the worker pool.
+        Args:
+          jobs - A list of (x, y, kwargs) tuples as accepted by
+                 RuleFit.fit
+        Returns:
+          A list of fit statistics tuples (see RuleFit.fit), in job order
+        """
+        return self._pool.map(_worker_fit, jobs)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        self._pool.terminate()